@@ -1,3 +1,12 @@
+from collections import defaultdict
+
+# Element keys pack (row, column) into a single int: row << KEY_SHIFT | column.
+# Rows must be non-negative and columns must lie in [0, COL_MASK] so that keys never alias;
+# set_element and the file reader reject anything else.
+KEY_SHIFT = 32
+COL_MASK = (1 << KEY_SHIFT) - 1
+
+
 class SparseMatrix:
     """
     Represents a sparse matrix, stored efficiently using a dictionary.
@@ -6,8 +15,9 @@ class SparseMatrix:
         rows (int): The number of rows in the matrix.
         cols (int): The number of columns in the matrix.
         matrix (dict): A dictionary storing the non-zero elements of the matrix,
-            where the keys are tuples of (row, column) and the values are the
-            corresponding element values.
+            where the keys are (row, column) packed into a single int
+            (row << KEY_SHIFT | column) and the values are the corresponding
+            element values.
     """
 
     def __init__(self, matrix_file_path=None, rows=None, cols=None):
@@ -54,15 +64,22 @@ class SparseMatrix:
             ValueError: If the input file has an incorrect format.
         """
         try:
-            with open(file_path, 'r') as file:
-                rows = int(file.readline().strip().split('=')[1])
-                cols = int(file.readline().strip().split('=')[1])
+            # The file is parsed as bytes, int() accepts them directly so lines need no decoding
+            with open(file_path, 'rb') as file:
+                rows = int(file.readline().strip().split(b'=')[1])
+                cols = int(file.readline().strip().split(b'=')[1])
                 matrix = {}
                 for line in file:
                     line = line.strip()
                     if line:
-                        row, col, value = map(int, line.strip('()').split(', '))
-                        matrix[(row, col)] = value
+                        row, col, value = map(int, line.strip(b'()').split(b','))
+                        if row < 0 or not 0 <= col <= COL_MASK:
+                            raise ValueError("Input file has wrong format")
+                        # Only non-zero elements are stored, explicit zeros clear the element
+                        if value != 0:
+                            matrix[row << KEY_SHIFT | col] = value
+                        else:
+                            matrix.pop(row << KEY_SHIFT | col, None)
                 return rows, cols, matrix
         except (IndexError, ValueError):
             raise ValueError("Input file has wrong format")
@@ -79,7 +96,10 @@ class SparseMatrix:
             int: The value of the element at the specified row and column.
                 If the element is not present in the matrix, 0 is returned.
         """
-        return self.matrix.get((row, col), 0)
+        # Out of range indices cannot be stored, and packing them could alias another element
+        if row < 0 or not 0 <= col <= COL_MASK:
+            return 0
+        return self.matrix.get(row << KEY_SHIFT | col, 0)
 
     def set_element(self, row, col, value):
         """
@@ -89,11 +109,16 @@ class SparseMatrix:
             row (int): The row index of the element.
             col (int): The column index of the element.
             value (int): The new value to be set for the element.
+
+        Raises:
+            ValueError: If the row is negative or the column is outside [0, COL_MASK].
         """
+        if row < 0 or not 0 <= col <= COL_MASK:
+            raise ValueError("Element indices are out of range")
         if value != 0:
-            self.matrix[(row, col)] = value
-        elif (row, col) in self.matrix:
-            del self.matrix[(row, col)]
+            self.matrix[row << KEY_SHIFT | col] = value
+        else:
+            self.matrix.pop(row << KEY_SHIFT | col, None)
 
     def add(self, other):
         """
@@ -112,10 +137,14 @@ class SparseMatrix:
             raise ValueError("Matrices must have the same dimensions for addition")
 
         result = SparseMatrix(rows=self.rows, cols=self.cols)
-        for (row, col), value in self.matrix.items():
-            result.set_element(row, col, value)
-        for (row, col), value in other.matrix.items():
-            result.set_element(row, col, result.get_element(row, col) + value)
+        matrix = result.matrix = dict(self.matrix)
+        get, pop = matrix.get, matrix.pop
+        for key, value in other.matrix.items():
+            new_value = get(key, 0) + value
+            if new_value != 0:
+                matrix[key] = new_value
+            else:
+                pop(key, None)
         return result
 
     def subtract(self, other):
@@ -135,10 +164,14 @@ class SparseMatrix:
             raise ValueError("Matrices must have the same dimensions for subtraction")
 
         result = SparseMatrix(rows=self.rows, cols=self.cols)
-        for (row, col), value in self.matrix.items():
-            result.set_element(row, col, value)
-        for (row, col), value in other.matrix.items():
-            result.set_element(row, col, result.get_element(row, col) - value)
+        matrix = result.matrix = dict(self.matrix)
+        get, pop = matrix.get, matrix.pop
+        for key, value in other.matrix.items():
+            new_value = get(key, 0) - value
+            if new_value != 0:
+                matrix[key] = new_value
+            else:
+                pop(key, None)
         return result
 
     def multiply(self, other):
@@ -159,12 +192,45 @@ class SparseMatrix:
             raise ValueError("The number of columns in the first matrix must be equal to "
                              "the number of rows in the second matrix for multiplication")
 
+        # Group the non-zero elements of both matrices by row, so each element (i, k)
+        # of the first matrix is only multiplied with the elements (k, j) it pairs with
+        other_rows = defaultdict(list)
+        for key, value in other.matrix.items():
+            other_rows[key >> KEY_SHIFT].append((key & COL_MASK, value))
+        self_rows = defaultdict(list)
+        for key, value in self.matrix.items():
+            self_rows[key & ~COL_MASK].append((key & COL_MASK, value))
+
+        # Rows are accumulated in a dense list indexed by column, which is cheaper than a dict
+        # update per product. The list is allocated once and only the columns a row touched
+        # are read back and reset, so the cost follows the number of products, not the width
+        width = max(other.cols, max((key & COL_MASK for key in other.matrix), default=-1) + 1)
+        row = [0] * width
         result = SparseMatrix(rows=self.rows, cols=other.cols)
-        for i in range(self.rows):
-            for j in range(other.cols):
-                value = sum(self.get_element(i, k) * other.get_element(k, j) for k in range(self.cols))
+        matrix = result.matrix
+        get_other_row = other_rows.get
+        for row_key, entries in self_rows.items():
+            if len(entries) == 1:
+                # A single element gives at most one non-zero product per column, so the
+                # products go straight into the result without accumulating
+                k, value = entries[0]
+                for j, other_value in get_other_row(k, ()):
+                    matrix[row_key | j] = value * other_value
+                continue
+
+            touched = []
+            for k, value in entries:
+                for j, other_value in get_other_row(k, ()):
+                    if not row[j]:
+                        touched.append(j)
+                    row[j] += value * other_value
+            # A column whose sum cancelled to zero and was touched again is listed twice,
+            # the second visit finds it already reset
+            for j in touched:
+                value = row[j]
                 if value != 0:
-                    result.set_element(i, j, value)
+                    matrix[row_key | j] = value
+                    row[j] = 0
         return result
 
     def write_matrix_to_file(self, file_path):
@@ -174,11 +240,11 @@ class SparseMatrix:
         Args:
             file_path (str): The file path where the matrix will be written.
         """
-        with open(file_path, 'w') as file:
-            file.write(f"rows={self.rows}\n")
-            file.write(f"cols={self.cols}\n")
-            for (row, col), value in sorted(self.matrix.items()):
-                file.write(f"({row}, {col}, {value})\n")
+        with open(file_path, 'w', buffering=1 << 20) as file:
+            file.write(f"rows={self.rows}\ncols={self.cols}\n")
+            # Packed keys sort in (row, column) order
+            file.writelines(f"({key >> KEY_SHIFT}, {key & COL_MASK}, {value})\n"
+                            for key, value in sorted(self.matrix.items()))
 
 
 if __name__ == "__main__":